@@ -1,15 +1,89 @@
 import logging
-from collections import deque
-from typing import List, Optional, Set, Tuple, Any, Generator
+from bisect import insort
+from operator import attrgetter
+from typing import List, Optional, Set, Tuple, Any, Generator, Callable, FrozenSet, Iterable, Dict
+from spacy import Language
+from spacy.attrs import POS, DEP
+from spacy.strings import get_string_id
 from spacy.tokens import Span, Doc, Token
 
 
+def _label_ids(*labels: str) -> FrozenSet[int]:
+    """
+    Converte rótulos (dependências ou classes gramaticais) para os IDs inteiros usados pelo spaCy,
+    permitindo comparar `token.dep`/`token.pos` diretamente, sem passar pelas propriedades `dep_`/`pos_`.
+    """
+    return frozenset(get_string_id(label) for label in labels)
+
+
+# Chave de ordenação dos tokens pela posição na sentença (implementada em C, sem lambda)
+_token_index = attrgetter("i")
+
+# Classes gramaticais verbais
+_VERBAL_POS = _label_ids("VERB", "AUX")
+
+# Classes gramaticais comparadas individualmente
+_PRON_POS = get_string_id("PRON")
+_PUNCT_POS = get_string_id("PUNCT")
+_VERB_POS = get_string_id("VERB")
+
+# Dependências comparadas individualmente
+_ROOT_DEP = get_string_id("ROOT")
+_COP_DEP = get_string_id("cop")
+_AUX_PASS_DEP = get_string_id("aux:pass")
+_OBJ_DEP = get_string_id("obj")
+_CONJ_DEP = get_string_id("conj")
+_CC_DEP = get_string_id("cc")
+_CASE_DEP = get_string_id("case")
+_MARK_DEP = get_string_id("mark")
+_APPOS_DEP = get_string_id("appos")
+_ADVMOD_DEP = get_string_id("advmod")
+
+
+# Resultado de `dep_.startswith(prefixo)` por (ID da dependência, prefixo). Cobre também subtipos
+# (ex: "nsubj:pass") sem materializar o rótulo textual a cada consulta.
+_DEP_PREFIX_MATCHES: Dict[Tuple[int, str], bool] = {}
+
+
+def _dep_has_prefix(token: Token, prefix: str) -> bool:
+    """Equivale a `token.dep_.startswith(prefix)`, consultando o rótulo textual uma única vez por dependência."""
+    key = (token.dep, prefix)
+    matches = _DEP_PREFIX_MATCHES.get(key)
+    if matches is None:
+        matches = _DEP_PREFIX_MATCHES[key] = token.dep_.startswith(prefix)
+    return matches
+
+
+# Resultado da verificação de pronome relativo por análise morfológica (hash dos traços).
+# O número de combinações de traços é limitado pelo modelo, então o cache não cresce indefinidamente.
+_RELATIVE_PRONOUN_BY_MORPH: Dict[int, bool] = {}
+
+
+def _is_relative_pronoun(token: Token) -> bool:
+    """Verifica se o token está marcado como pronome relativo (PronType=Rel) na morfologia."""
+    morph = token.morph
+    is_relative = _RELATIVE_PRONOUN_BY_MORPH.get(morph.key)
+    if is_relative is None:
+        # Os traços só são decompostos na primeira vez que a análise aparece
+        is_relative = _RELATIVE_PRONOUN_BY_MORPH[morph.key] = 'Rel' in morph.get("PronType", ())
+    return is_relative
+
+
 class TripleElement:
     """
     Representa um componente de uma extração (sujeito, relação ou complemento).
     É construído em torno de um token principal e pode incluir outros tokens
     que compõem o sintagma.
     """
+    # Criado em grande quantidade (vários por extração); dispensa o `__dict__` por instância
+    __slots__ = ('core', 'pieces', '_piece_ids', '_text', '_str_cache', '_tokens_cache', 'is_sinthetic',
+                 'is_from_appositive')
+
+    # Delimitadores preservados nas bordas do texto de saída
+    _PARENTHESES = frozenset({'[', ']', '(', ')', '{', '}'})
+
+    # Pares de delimitadores que, envolvendo todo o elemento, são removidos da saída
+    _ENCLOSING_PAIRS = frozenset({('[', ']'), ('(', ')'), ('{', '}')})
 
     def __init__(self, token: Token = None, text: Optional[str] = None):
         """
@@ -21,8 +95,12 @@ class TripleElement:
                                             Útil para relações sintéticas como "é".
         """
         self.core: Optional[Token] = token
-        self.pieces: List[Token] = []
+        self.pieces: List[Token] = []  # Mantidas ordenadas por `Token.i`
+        self._piece_ids: Set[int] = set()
         self._text: Optional[str] = text
+        # Caches invalidados sempre que uma peça é adicionada
+        self._str_cache: Optional[str] = None
+        self._tokens_cache: Optional[List[Token]] = None
         self.is_sinthetic = True if text else False
         self.is_from_appositive = False
 
@@ -30,9 +108,16 @@ class TripleElement:
         """Retorna a representação textual do elemento, limpando pontuações e conectores nas bordas."""
         if self._text:
             return self._text
-        # get_output_tokens já retorna os tokens limpos e ordenados
-        text = ' '.join([token.text for token in self.get_output_tokens()])
-        return text.strip()
+        # O texto é pedido várias vezes para o mesmo elemento (deduplicação, serialização)
+        if self._str_cache is None:
+            # get_output_tokens já retorna os tokens limpos e ordenados
+            text = ' '.join([token.text for token in self.get_output_tokens()])
+            self._str_cache = text.strip()
+        return self._str_cache
+
+    def __contains__(self, token: Token) -> bool:
+        """Verifica se o token é o núcleo ou uma das peças do elemento."""
+        return token.i in self._piece_ids or (self.core is not None and self.core.i == token.i)
 
     def is_empty(self) -> bool:
         """Verifica se o elemento não contém tokens ou texto."""
@@ -47,39 +132,52 @@ class TripleElement:
         if not tokens:
             return []
 
-        _PARANTHESES = {'[', ']', '(', ')', '{', '}'}
+        # Os limites são ajustados por índice e a lista é fatiada uma única vez no final
+        start, end = 0, len(tokens)
+
         # remove parenteses e colchetes do início e do fim, apenas se os mesmos forem o primeiro ou último token
-        if (tokens[0].text, tokens[-1].text) in {('[', ']'), ('(', ')'), ('{', '}')}:
-            tokens = tokens[1:-1]
+        if (tokens[0].text, tokens[-1].text) in self._ENCLOSING_PAIRS:
+            start, end = 1, end - 1
 
         # Remove conectores e pontuações do início
-        while tokens and ((tokens[0].pos_ == 'PUNCT' and tokens[0].text not in _PARANTHESES) or tokens[0].dep_ == 'cc'):
-            tokens.pop(0)
+        while start < end and ((tokens[start].pos == _PUNCT_POS and tokens[start].text not in self._PARENTHESES)
+                               or tokens[start].dep == _CC_DEP):
+            start += 1
 
         # Remove pontuações do final, mantendo apenas as que são necessárias
-        while tokens and (tokens[-1].pos_ == 'PUNCT' and tokens[-1].text not in _PARANTHESES):
-            tokens.pop(-1)
+        while end > start and (tokens[end - 1].pos == _PUNCT_POS and tokens[end - 1].text not in self._PARENTHESES):
+            end -= 1
 
-        return tokens
+        return tokens[start:end]
 
     def get_all_tokens(self) -> List[Token]:
-        """Retorna todos os tokens únicos do elemento, ordenados por sua posição na sentença."""
-        # Combina o núcleo e as peças, garantindo que não haja None
-        tokens = [t for t in [self.core] + self.pieces if t is not None]
-
-        # Garante tokens únicos e os ordena pelo índice na sentença
-        seen_ids = set()
-        unique_tokens = []
-        for token in sorted(tokens, key=lambda x: x.i):
-            if token.i not in seen_ids:
-                unique_tokens.append(token)
-                seen_ids.add(token.i)
-        return unique_tokens
+        """
+        Retorna todos os tokens únicos do elemento, ordenados por sua posição na sentença.
+        A lista é compartilhada entre chamadas e não deve ser modificada.
+        """
+        if self._tokens_cache is None:
+            # As peças já são únicas e ordenadas; basta posicionar o núcleo, se ele ainda não for uma peça
+            tokens = list(self.pieces)
+            if self.core is not None and self.core.i not in self._piece_ids:
+                insort(tokens, self.core, key=_token_index)
+            self._tokens_cache = tokens
+        return self._tokens_cache
+
+    def get_token_indices(self) -> Set[int]:
+        """Retorna um novo conjunto com os índices de todos os tokens do elemento."""
+        indices = set(self._piece_ids)
+        if self.core is not None:
+            indices.add(self.core.i)
+        return indices
 
     def add_piece(self, piece: Token):
         """Adiciona um token às peças do elemento, se ainda não estiver presente."""
-        if piece and piece not in self.pieces:
-            self.pieces.append(piece)
+        if piece and piece.i not in self._piece_ids:
+            self._piece_ids.add(piece.i)
+            self._str_cache = None
+            self._tokens_cache = None
+            # Mantém as peças ordenadas pela posição na sentença
+            insort(self.pieces, piece, key=_token_index)
 
     def merge(self, other_element: 'TripleElement'):
         """
@@ -98,12 +196,19 @@ class Extraction:
     """
     Representa uma única tripla Sujeito-Relação-Complemento (arg1, rel, arg2).
     """
+    __slots__ = ('subject', 'relation', 'complement', 'sub_extractions', 'visited_indices')
+
+    # Classes gramaticais que, sozinhas, não podem ser sujeito quando são pronomes relativos
+    _RELATIVE_SUBJECT_POS = _label_ids("PRON", "SCONJ")
 
     def __init__(self, subject: TripleElement = None, relation: TripleElement = None, complement: TripleElement = None):
         self.subject = subject
         self.relation = relation
         self.complement = complement
         self.sub_extractions: List['Extraction'] = []  # Lista para extrações aninhadas (ccomp/advcl)
+        # Índices dos tokens de sujeito e relação, preenchidos na extração da relação e reaproveitados
+        # como ponto de partida da busca de complementos
+        self.visited_indices: Optional[Set[int]] = None
 
     def __iter__(self) -> Generator[tuple[str, Any], Any, None]:
         """
@@ -127,14 +232,15 @@ class Extraction:
 
         # A relação deve conter um verbo.
         if self.relation and not self.relation.is_sinthetic and not any(
-            t.pos_ in ['VERB', 'AUX'] for t in self.relation.get_all_tokens()):
+            t.pos in _VERBAL_POS for t in self.relation.get_all_tokens()):
             return False
 
         # O sujeito não pode ser apenas um pronome relativo.
         if self.subject and not self.subject.is_empty():
             subject_tokens = self.subject.get_all_tokens()
-            if len(subject_tokens) == 1 and subject_tokens[0].pos_ in ['PRON', 'SCONJ'] and 'Rel' in subject_tokens[
-                0].morph.get("PronType", []):
+            # A consulta à morfologia só é feita depois das verificações baratas
+            if len(subject_tokens) == 1 and subject_tokens[0].pos in self._RELATIVE_SUBJECT_POS and (
+                _is_relative_pronoun(subject_tokens[0])):
                 return False
 
         return True
@@ -176,34 +282,70 @@ class Extractor:
     a partir de um documento processado pelo spaCy.
     """
     # Dependências que compõem um sintagma nominal (sujeito ou complemento)
-    _NOMINAL_PHRASE_DEPS = {"nummod", "advmod", "nmod", "amod", "dep", "det", "case", "flat", "flat:name", "punct"}
+    _NOMINAL_PHRASE_DEPS = _label_ids("nummod", "advmod", "nmod", "amod", "dep", "det", "case", "flat", "flat:name",
+                                      "punct")
+
+    # Conjuntos aceitos no sintagma nominal, indexados por (ignore_appos, ignore_conjunctions)
+    _NOMINAL_PHRASE_DEP_VARIANTS = {
+        (False, False): _NOMINAL_PHRASE_DEPS | _label_ids("conj", "cc", "appos"),
+        (False, True): _NOMINAL_PHRASE_DEPS | _label_ids("appos"),
+        (True, False): _NOMINAL_PHRASE_DEPS | _label_ids("conj", "cc"),
+        (True, True): _NOMINAL_PHRASE_DEPS,
+    }
 
     # Dependências que podem fazer parte de uma locução verbal
-    _RELATION_VERB_DEPS = {"aux", "aux:pass", "xcomp"}
+    _RELATION_VERB_DEPS = _label_ids("aux", "aux:pass", "xcomp")
 
     # Modificadores que podem se juntar à relação (ex: pronomes clíticos)
-    _RELATION_MODIFIER_DEPS = {"expl:pv"}
+    _RELATION_MODIFIER_DEPS = _label_ids("expl:pv")
 
     # Advérbios comuns que modificam o verbo e devem ser incluídos na relação
-    _RELATION_ADVERBS = {"não", "ja", "ainda", "também", "nunca"}
+    _RELATION_ADVERBS = frozenset({"não", "ja", "ainda", "também", "nunca"})
+
+    # Ação aplicada a cada dependência que pode estender a relação; os demais filhos são descartados de imediato
+    _VERB_PART_ACTION, _MODIFIER_ACTION, _ADVERB_ACTION = 1, 2, 3
+    _RELATION_CHILD_ACTIONS = {**dict.fromkeys(_RELATION_VERB_DEPS, _VERB_PART_ACTION),
+                               **dict.fromkeys(_RELATION_MODIFIER_DEPS, _MODIFIER_ACTION),
+                               _ADVMOD_DEP: _ADVERB_ACTION}
 
     # Dependências que tipicamente iniciam um complemento
-    _COMPLEMENT_HEAD_DEPS = {"obj", "iobj", "xcomp", "obl", "advmod", "nmod", "ROOT"}
+    _COMPLEMENT_HEAD_DEPS = _label_ids("obj", "iobj", "xcomp", "obl", "advmod", "nmod", "ROOT")
 
     # Dependências que iniciam orações subordinadas
-    _SUBORDINATE_CLAUSE_DEPS = {"advcl", "ccomp"}
+    _SUBORDINATE_CLAUSE_DEPS = _label_ids("advcl", "ccomp")
 
     # Dependências que NUNCA devem ser parte de um complemento (pois têm suas próprias funções)
-    _COMPLEMENT_IGNORE_DEPS = {'nsubj', 'nsubj:pass', 'csubj', 'csubj:pass'}
+    _COMPLEMENT_IGNORE_DEPS = _label_ids('nsubj', 'nsubj:pass', 'csubj', 'csubj:pass')
 
     # A busca por complemento deve PARAR ao encontrá-las para evitar que o arg2 se estenda demais.
-    _COMPLEMENT_BOUNDARY_DEPS = {"mark"}
+    _COMPLEMENT_BOUNDARY_DEPS = _label_ids("mark")
+
+    # Combina as dependências que devem ser ignoradas com as que delimitam uma conjunção
+    _COMPLEMENT_STOP_DEPS = _COMPLEMENT_IGNORE_DEPS | _COMPLEMENT_BOUNDARY_DEPS
 
     # Dependências que identificam um sujeito
-    _SUBJECT_DEPS = {"nsubj", "nsubj:pass", "csubj", "csubj:pass"}
+    _SUBJECT_DEPS = _label_ids("nsubj", "nsubj:pass", "csubj", "csubj:pass")
+
+    # Sujeitos oracionais, dentre as dependências de sujeito
+    _CLAUSAL_SUBJECT_DEPS = _label_ids("csubj", "csubj:pass")
 
     # Verbos que podem ter o sujeito lógico na posição de objeto (voz passiva sintética, etc.)
-    _EXISTENTIAL_VERBS = {'haver', 'ocorrer', 'acontecer', 'existir', 'surgir'}
+    _EXISTENTIAL_VERBS = frozenset({'haver', 'ocorrer', 'acontecer', 'existir', 'surgir'})
+
+    # Conectores (lemas) que permitem expandir verbos coordenados em novas extrações
+    _VERBAL_COORDINATORS = frozenset({'e', 'ou'})
+
+    # Dependências de orações adjetivas (relativas)
+    _RELATIVE_CLAUSE_DEPS = _label_ids("acl", "acl:relcl")
+
+    # Classes gramaticais de predicados nominais (ex: "João é alto")
+    _NOMINAL_PREDICATE_POS = _label_ids("ADJ", "NOUN")
+
+    # Dependências de verbos auxiliares e cópulas, cujo sujeito está ligado ao head
+    _AUXILIARY_DEPS = _label_ids("cop", "aux", "aux:pass")
+
+    # Dependências de complementos oracionais
+    _CLAUSAL_COMPLEMENT_DEPS = _label_ids("ccomp", "xcomp")
 
     def __init__(self, config: ExtractorConfig = None):
         self.config = config if config else ExtractorConfig()
@@ -215,6 +357,40 @@ class Extractor:
             extractions.extend(self.get_extractions_from_sentence(sentence))
         return extractions
 
+    def get_extractions_from_docs(self, docs: Iterable[Doc]) -> Generator[List[Extraction], Any, None]:
+        """
+        Gera a lista de extrações de cada documento de uma sequência, na mesma ordem.
+
+        Os rótulos de dependência e classes gramaticais já são resolvidos para IDs inteiros na
+        carga do módulo, então nada é recalculado entre documentos. Combinado com
+        `nlp.pipe(textos, n_process=N)`, a análise sintática roda em paralelo enquanto a extração
+        consome os documentos à medida que ficam prontos.
+
+        Args:
+            docs (Iterable[Doc]): Documentos já processados pelo spaCy.
+        """
+        for doc in docs:
+            yield self.get_extractions_from_doc(doc)
+
+    def get_extractions_from_texts(self, nlp: Language, texts: Iterable[str], batch_size: int = 64,
+                                   n_process: int = 1, disable: Iterable[str] = ()) -> Generator[
+        List[Extraction], Any, None]:
+        """
+        Processa os textos em lote com `nlp.pipe` e gera a lista de extrações de cada documento.
+
+        O extrator lê apenas a análise de dependências, as classes gramaticais, a morfologia e os lemas,
+        portanto componentes como o NER podem ser desativados via `disable`.
+
+        Args:
+            nlp (Language): Pipeline do spaCy com parser, tagger/morphologizer e lematizador.
+            texts (Iterable[str]): Textos a serem processados.
+            batch_size (int): Quantidade de textos por lote.
+            n_process (int): Número de processos usados pelo `nlp.pipe`.
+            disable (Iterable[str]): Componentes do pipeline que não precisam ser executados.
+        """
+        docs = nlp.pipe(texts, batch_size=batch_size, n_process=n_process, disable=list(disable))
+        yield from self.get_extractions_from_docs(docs)
+
     def get_extractions_from_sentence(self, sentence: Span) -> list[Extraction]:
         """
         Extrai triplas de uma única sentença.
@@ -222,89 +398,117 @@ class Extractor:
         e a partir deles, busca por sujeitos, relações e complementos.
         """
         final_extractions: List[Extraction] = []
-        processed_tokens = set()
+        # Marcação dos tokens já processados, indexada pela posição do token na sentença
+        processed_tokens = bytearray(len(sentence))
+        offset = sentence.start
+        # As mensagens de depuração convertem todas as extrações em texto; só as monta se forem emitidas
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
 
         # 1. Extração baseada em predicados verbais
-        for token in sentence:
-            if token.i in processed_tokens:
+        for token in self.__predicate_candidates(sentence):
+            if processed_tokens[token.i - offset]:
                 continue
 
             # Isso evita extrações duplicadas
-            if token.dep_.startswith('csubj'):
+            if _dep_has_prefix(token, 'csubj'):
                 continue
 
-            is_verb_head = token.pos_ in ['VERB', 'AUX']
+            is_verb_head = token.pos in _VERBAL_POS
 
             # Ignora verbos que estão em orações relativas, pois eles funcionam como
             # modificadores e a lógica atual não consegue resolver seu sujeito corretamente.
-            is_in_relative_conjunction = token.dep_ in ['acl', 'acl:relcl']
+            is_in_relative_conjunction = token.dep in self._RELATIVE_CLAUSE_DEPS
 
-            is_nominal_predicate_root = token.dep_ == 'ROOT' and token.pos_ in ['ADJ', 'NOUN'] and any(
-                c.dep_ == 'cop' for c in token.children)
+            # Em predicados nominais, a extração parte da primeira cópula ligada à raiz
+            copula = None
+            if token.dep == _ROOT_DEP and token.pos in self._NOMINAL_PREDICATE_POS:
+                copula = next((c for c in token.children if c.dep == _COP_DEP), None)
+            is_nominal_predicate_root = copula is not None
 
             # A condição principal agora impede o início da extração para verbos em orações relativas.
             if (is_verb_head and not is_in_relative_conjunction) or is_nominal_predicate_root:
-                start_node = token
-
-                if is_nominal_predicate_root:
-                    copula_candidates = [c for c in token.children if c.dep_ == 'cop']
-                    if not copula_candidates: continue
-                    start_node = copula_candidates[0]
+                start_node = copula if is_nominal_predicate_root else token
 
                 base_extractions = self.__process_conjunction(start_node)
-                logging.debug(f"Extrações encontradas: {[extr.to_tuple() for extr in base_extractions]}")
+                if debug_enabled:
+                    logging.debug(f"Extrações encontradas: {[extr.to_tuple() for extr in base_extractions]}")
                 final_extractions.extend(base_extractions)
 
-                for extr in base_extractions:
-                    # Adiciona todos os tokens da extração e sub-extrações para evitar reprocessamento
-                    q = deque([extr])
-                    while q:
-                        current_extr = q.popleft()
-                        for el in [current_extr.subject, current_extr.relation, current_extr.complement]:
-                            if el:
-                                for t in el.get_all_tokens():
-                                    processed_tokens.add(t.i)
-                        q.extend(current_extr.sub_extractions)
+                # Adiciona todos os tokens das extrações e sub-extrações para evitar reprocessamento.
+                # A ordem de visita não importa, então uma pilha simples basta.
+                pending = list(base_extractions)
+                while pending:
+                    current_extr = pending.pop()
+                    for el in (current_extr.subject, current_extr.relation, current_extr.complement):
+                        if el:
+                            for t in el.get_all_tokens():
+                                processed_tokens[t.i - offset] = 1
+                    pending.extend(current_extr.sub_extractions)
 
         # 2. Extração baseada em apostos
         if self.config.appositive:
             appositive_extractions = self.__extract_from_appositives(sentence)
-            logging.debug(f"Extrações de aposto encontradas: {[extr.to_tuple() for extr in appositive_extractions]}")
+            if debug_enabled:
+                logging.debug(f"Extrações de aposto encontradas: {[extr.to_tuple() for extr in appositive_extractions]}")
             if self.config.appositive_transitivity:
                 # Aplica a regra de transitividade usando as extrações de aposto e as já encontradas
                 transitive_extractions = self.__apply_appositive_transitivity(appositive_extractions, final_extractions)
-                logging.debug(f"Extrações transitivas aplicadas: {[extr.to_tuple() for extr in transitive_extractions]}")
+                if debug_enabled:
+                    logging.debug(f"Extrações transitivas aplicadas: {[extr.to_tuple() for extr in transitive_extractions]}")
                 final_extractions.extend(transitive_extractions)
 
             final_extractions.extend(appositive_extractions)
 
-        # 3. Remove duplicatas e retorna extrações válidas
-        unique_extractions = []
-        seen = set()
+        # 3. Remove duplicatas e retorna extrações válidas.
+        # O dicionário preserva a ordem de inserção, mantendo a primeira ocorrência de cada representação.
+        unique_extractions = {}
         for extr in final_extractions:
+            # A validação é barata e evita gerar o texto de extrações que serão descartadas
+            if not extr.is_valid():
+                if debug_enabled:
+                    logging.debug(f"Extração duplicada ou inválida ignorada: {extr.to_tuple()}")
+                continue
             representation = extr.to_tuple()
-            if representation not in seen and extr.is_valid():
-                seen.add(representation)
-                unique_extractions.append(extr)
-            else:
+            if unique_extractions.setdefault(representation, extr) is not extr and debug_enabled:
                 logging.debug(f"Extração duplicada ou inválida ignorada: {representation}")
 
-        logging.debug(f"Extrações finais únicas: {[extr.to_tuple() for extr in unique_extractions]}")
+        if debug_enabled:
+            logging.debug(f"Extrações finais únicas: {list(unique_extractions)}")
 
-        return unique_extractions
+        return list(unique_extractions.values())
 
-    def __process_conjunction(self, start_node: Token) -> List[Extraction]:
+    @classmethod
+    def __predicate_candidates(cls, sentence: Span) -> List[Token]:
+        """
+        Pré-seleciona os tokens que podem iniciar uma extração: verbos fora de orações relativas
+        e raízes de predicados nominais. Os atributos são exportados de uma só vez com `Doc.to_array`,
+        evitando consultar cada token da sentença individualmente.
+        """
+        doc = sentence.doc
+        attributes = doc.to_array([POS, DEP])[sentence.start:sentence.end].tolist()
+        return [doc[sentence.start + offset] for offset, (pos, dep) in enumerate(attributes)
+                if (pos in _VERBAL_POS and dep not in cls._RELATIVE_CLAUSE_DEPS)
+                or (dep == _ROOT_DEP and pos in cls._NOMINAL_PREDICATE_POS)]
+
+    def __process_conjunction(self, start_node: Token,
+                              subject_element: Optional[TripleElement] = None) -> List[Extraction]:
         """
         Processa uma conjunção (principal ou subordinada), permitindo recursão e
         distribuindo complementos compartilhados em verbos coordenados.
+
+        Args:
+            start_node (Token): Token verbal (ou cópula) que inicia a extração.
+            subject_element (Optional[TripleElement]): Sujeito já encontrado para `start_node`, se houver.
+                                                       Evita repetir a busca feita pelo chamador.
         """
-        subject_element = self.__find_subject(start_node)
-        logging.debug(f"Encontrado sujeito: {subject_element} para o verbo {start_node.text}")
+        if subject_element is None:
+            subject_element = self.__find_subject(start_node)
+        logging.debug("Encontrado sujeito: %s para o verbo %s", subject_element, start_node.text)
 
         if subject_element is None:
             if not self.config.hidden_subjects:
                 is_impersonal = start_node.morph.get("Person") == ["3"] and not any(
-                    c.dep_ in self._SUBJECT_DEPS for c in start_node.children)
+                    c.dep in self._SUBJECT_DEPS for c in start_node.children)
                 if not is_impersonal:
                     return []
             subject_element = TripleElement()
@@ -331,14 +535,14 @@ class Extractor:
             if last_complement and not last_complement.is_empty():
 
                 # Só propague complementos de um verbo de ação (VERB).
-                if last_verb.pos_ == 'VERB':
+                if last_verb.pos == _VERB_POS:
                     # Itera sobre as extrações/verbos anteriores
                     for i in range(len(completed_sr_pairs) - 1):
                         current_extraction, current_verb = completed_sr_pairs[i]
 
                         # Se a extração atual não tiver complemento E seu verbo raiz também for VERB
                         if (
-                            not current_extraction.complement or current_extraction.complement.is_empty()) and current_verb.pos_ == 'VERB':
+                            not current_extraction.complement or current_extraction.complement.is_empty()) and current_verb.pos == _VERB_POS:
                             # Propaga o complemento
                             current_extraction.complement = last_complement
 
@@ -349,34 +553,35 @@ class Extractor:
     def __find_subject(self, verb_token: Token) -> Optional[TripleElement]:
         """Encontra o sujeito de um determinado verbo, lidando com voz passiva, orações relativas e verbos existenciais."""
         search_node = verb_token
-        is_passive = any(c.dep_ == 'aux:pass' for c in search_node.children)
+        is_passive = any(c.dep == _AUX_PASS_DEP for c in search_node.children)
 
         # Se o token for um auxiliar ou cópula, o sujeito estará ligado ao verbo principal
-        if verb_token.dep_ in ['cop', 'aux', 'aux:pass']:
+        if verb_token.dep in self._AUXILIARY_DEPS:
             search_node = verb_token.head
-            is_passive = is_passive or any(c.dep_ == 'aux:pass' for c in search_node.children)
-            logging.debug(f"Verbo auxiliar ou cópula encontrado: {verb_token.text}, buscando sujeito no head: {search_node.text}")
+            is_passive = is_passive or any(c.dep == _AUX_PASS_DEP for c in search_node.children)
+            logging.debug("Verbo auxiliar ou cópula encontrado: %s, buscando sujeito no head: %s",
+                          verb_token.text, search_node.text)
 
         # Busca por sujeito (nsubj, csubj)
         for child in search_node.children:
-            if child.dep_ in self._SUBJECT_DEPS:
-                logging.debug(f"Encontrado sujeito: {child.text} (dep: {child.dep_})")
+            if child.dep in self._SUBJECT_DEPS:
+                logging.debug("Encontrado sujeito: %s (dep: %s)", child.text, child.dep_)
                 # Se o sujeito for um pronome relativo, busca o seu antecedente
-                if child.pos_ == 'PRON' and 'Rel' in child.morph.get("PronType", []):
+                if child.pos == _PRON_POS and _is_relative_pronoun(child):
                     return self.__dfs_for_nominal_phrase(child.head, is_subject=True)
                 # Trata o sujeito oracional (csubj) construindo-o como um complemento.
-                if child.dep_.startswith('csubj'):
+                if child.dep in self._CLAUSAL_SUBJECT_DEPS:
                     return self.__dfs_for_complement(child, set())
                 return self.__dfs_for_nominal_phrase(child, is_subject=True, ignore_appos=self.config.appositive)
 
         # Lógica para voz passiva e verbos existenciais (ex: "vende-se casas", "há vagas")
         if is_passive or search_node.lemma_ in self._EXISTENTIAL_VERBS:
             for child in search_node.children:
-                if child.dep_ == 'obj':
+                if child.dep == _OBJ_DEP:
                     return self.__dfs_for_nominal_phrase(child, is_subject=False)
 
         # Se o verbo estiver em uma oração adjetiva, o sujeito é o núcleo da oração principal
-        if search_node.dep_ in ['acl', 'acl:relcl']:
+        if search_node.dep in self._RELATIVE_CLAUSE_DEPS:
             return self.__dfs_for_nominal_phrase(search_node.head, is_subject=True)
 
         return None
@@ -384,21 +589,23 @@ class Extractor:
     def __extract_relation_and_conjunctions(self, subject: Optional[TripleElement], start_node: Token) -> List[
         Tuple[Extraction, Token]]:
         """Extrai a relação base e expande para relações coordenadas (conj)."""
-        subject_tokens = {p.i for p in subject.get_all_tokens()} if subject else set()
+        subject_tokens = subject.get_token_indices() if subject else set()
 
         base_relation, effective_verb = self.__build_relation_element(start_node, subject_tokens)
         if not base_relation:
             return []
 
         extraction = Extraction(subject=subject, relation=base_relation)
+        extraction.visited_indices = subject_tokens | base_relation.get_token_indices()
         extractions_found = [(extraction, effective_verb)]
 
         if self.config.coordinating_conjunctions and effective_verb:
-            for child in sorted(effective_verb.children, key=lambda t: t.i):
+            for child in effective_verb.children:
                 if self._is_valid_verbal_conjunction(child):
                     new_relation, new_effective_verb = self.__build_relation_element(child, set())
                     if new_relation:
                         new_extraction = Extraction(subject=subject, relation=new_relation)
+                        new_extraction.visited_indices = subject_tokens | new_relation.get_token_indices()
                         extractions_found.append((new_extraction, new_effective_verb))
 
         return extractions_found
@@ -410,9 +617,9 @@ class Extractor:
         if not extraction.relation or not extraction.relation.core:
             return [extraction] if extraction.subject and extraction.is_valid() else []
 
-        # Tokens já usados no sujeito e na relação não podem fazer parte do complemento
-        base_visited = {tok.i for tok in extraction.subject.get_all_tokens()} if extraction.subject else set()
-        base_visited.update(tok.i for tok in extraction.relation.get_all_tokens())
+        # Tokens já usados no sujeito e na relação não podem fazer parte do complemento.
+        # O conjunto vem pronto da extração da relação e é exclusivo desta extração.
+        base_visited = extraction.visited_indices
 
         # Identifica as "cabeças" de cada complemento (ex: múltiplos objetos)
         complement_heads = []
@@ -421,19 +628,18 @@ class Extractor:
         # Lógica para identificar a cabeça do complemento em orações de cópula
         # Se a relação é uma cópula, o seu head (predicado nominal) é a cabeça do complemento.
         relation_core = extraction.relation.core
-        if relation_core and relation_core.dep_ == 'cop':
-            nominal_predicate = relation_core.head
-            if nominal_predicate.i not in base_visited:
-                complement_heads.append(nominal_predicate)
+        nominal_predicate = relation_core.head if relation_core.dep == _COP_DEP else None
+        if nominal_predicate is not None and nominal_predicate.i not in base_visited:
+            complement_heads.append(nominal_predicate)
 
-        for child in sorted(complement_root.children, key=lambda t: t.i):
+        for child in complement_root.children:
             if child.i in base_visited:
                 continue
             # Adiciona a cabeça do complemento se não for o predicado já adicionado
-            if child.dep_ in self._COMPLEMENT_HEAD_DEPS and child not in complement_heads:
+            if child.dep in self._COMPLEMENT_HEAD_DEPS and child not in complement_heads:
                 complement_heads.append(child)
             # Separa as orações subordinadas para tratamento especial
-            elif self.config.subordinating_conjunctions and child.dep_ in self._SUBORDINATE_CLAUSE_DEPS:
+            elif self.config.subordinating_conjunctions and child.dep in self._SUBORDINATE_CLAUSE_DEPS:
                 subordinate_conjunction_heads.append(child)
 
         # Processa complementos nominais/verbais normais e suas conjunções
@@ -445,43 +651,43 @@ class Extractor:
 
             # Encontra todos os complementos coordenados a partir da cabeça atual.
             # Ex: "banana, pera e maça"
+            # A própria lista serve de fila da busca em largura: o laço percorre também
+            # os elementos acrescentados durante a iteração, na ordem em que são encontrados.
             conjuncts = [head]
-            q = deque([head])
             # Garante que não entramos em loop e coletamos cada conjunção apenas uma vez
             visited_conj_indices = {head.i}
 
-            while q:
-                token = q.popleft()
+            for token in conjuncts:
                 for child in token.children:
                     # Adiciona tokens ligados por 'conj'
-                    if child.dep_ == 'conj' and child.i not in visited_conj_indices:
+                    if child.dep == _CONJ_DEP and child.i not in visited_conj_indices:
                         conjuncts.append(child)
                         visited_conj_indices.add(child.i)
-                        q.append(child)
 
             # Marca todas as conjunções encontradas como processadas para evitar trabalho duplicado
             processed_in_this_run.update(visited_conj_indices)
 
+            # Isola cada parte, ignorando as outras conjunções na busca. As subárvores de cabeças distintas
+            # são disjuntas, então um único conjunto de visitados é compartilhado por todas as buscas.
+            base_visited.update(visited_conj_indices)
+
             # Para cada elemento da coordenação, cria uma parte de complemento separada.
             # Ex: uma para "de banana", uma para "pera", uma para "maça"
-            main_case_token = next((child for child in head.children if child.dep_ == 'case'), None)
+            main_case_token = next((child for child in head.children if child.dep == _CASE_DEP), None)
 
             for conjunct_head in conjuncts:
-                # Isola a parte atual, ignorando as outras conjunções na busca
-                temp_visited = base_visited.union(visited_conj_indices - {conjunct_head.i})
-
                 # Usa a função de construção de sintagma nominal para complementos de cópula
-                if relation_core and relation_core.dep_ == 'cop' and conjunct_head == relation_core.head:
+                if nominal_predicate is not None and conjunct_head.i == nominal_predicate.i:
                     component = self.__dfs_for_nominal_phrase(conjunct_head, is_subject=False)
                 else:
-                    component = self.__dfs_for_complement(conjunct_head, temp_visited)
+                    component = self.__dfs_for_complement(conjunct_head, base_visited)
 
                 if not component.is_empty():
                     # Propaga a preposição (ex: "de") do elemento principal para os outros, se necessário.
                     # Isso garante que a extração seja "(gosto, de pera)" e não "(gosto, pera)".
                     if conjunct_head != head and main_case_token:
                         # Verifica se o componente já não possui sua própria preposição.
-                        has_own_case = any(t.dep_ == 'case' for t in component.get_all_tokens())
+                        has_own_case = any(t.dep == _CASE_DEP for t in component.get_all_tokens())
                         if not has_own_case:
                             component.add_piece(main_case_token)
 
@@ -496,12 +702,12 @@ class Extractor:
             if conjunction_subject is not None:
                 # Caso 1: Oração com sujeito próprio. Gera uma sub-extração.
                 # Adiciona o 'mark' (ex: "que") ao complemento da extração principal.
-                mark_token = next((c for c in head.children if c.dep_ == 'mark'), None)
+                mark_token = next((c for c in head.children if c.dep == _MARK_DEP), None)
                 if mark_token:
                     mark_complement = TripleElement(mark_token)
                     complement_parts.append(mark_complement)
 
-                sub_extrs = self.__process_conjunction(head)
+                sub_extrs = self.__process_conjunction(head, conjunction_subject)
                 extraction.sub_extractions.extend(sub_extrs)
             else:
                 # Caso 2: Oração sem sujeito. Trata como um complemento normal.
@@ -517,22 +723,27 @@ class Extractor:
                 final_extractions.append(extraction)
             return final_extractions
 
-        # Cria uma extração com o complemento completo (todos os complementos juntos)
+        # Caso mais comum: um único complemento, usado diretamente sem mesclagem nem decomposição
+        if len(complement_parts) == 1:
+            extraction.complement = complement_parts[0]
+            final_extractions.append(extraction)
+            return final_extractions
+
+        # Cria uma extração com o complemento completo (todos os complementos juntos) e, se houver
+        # múltiplos complementos, decompõe em extrações menores na mesma passada.
+        decompose = len(complement_parts) > 1 and self.config.coordinating_conjunctions
         full_complement = TripleElement()
+        decomposed_extractions = []
         for part in complement_parts:
             full_complement.merge(part)
+            if decompose and not part.is_empty():
+                decomposed_extractions.append(Extraction(extraction.subject, extraction.relation, part))
 
         if not full_complement.is_empty() or extraction.sub_extractions:
             extraction.complement = full_complement
             final_extractions.append(extraction)
 
-        # Se houver múltiplos complementos, decompõe em extrações menores.
-        if len(complement_parts) > 1 and self.config.coordinating_conjunctions:
-            for component in complement_parts:
-                if not component.is_empty():
-                    decomposed_extraction = Extraction(extraction.subject, extraction.relation, component)
-                    final_extractions.append(decomposed_extraction)
-
+        final_extractions.extend(decomposed_extractions)
         return final_extractions
 
     def __extract_from_appositives(self, sentence: Span) -> List[Extraction]:
@@ -541,14 +752,19 @@ class Extractor:
         Ex: "João, o carpinteiro, ..." -> (João, é, o carpinteiro)
         """
         extractions = []
-        for token in sentence:
-            if token.dep_ == 'appos':
+        # Os apostos são raros; as dependências são exportadas de uma só vez e apenas
+        # as posições marcadas como `appos` são materializadas como tokens
+        doc = sentence.doc
+        dependencies = doc.to_array(DEP)[sentence.start:sentence.end].tolist()
+        for offset, dep in enumerate(dependencies):
+            if dep == _APPOS_DEP:
+                token = doc[sentence.start + offset]
                 subject_head = token.head
 
                 logging.debug(f"Encontrado aposto: {token.text} (head: {subject_head.text})")
 
                 # Evita extrair apostos de complementos de oração
-                if subject_head.dep_ in ['ccomp', 'xcomp']:
+                if subject_head.dep in self._CLAUSAL_COMPLEMENT_DEPS:
                     logging.debug(f"Ignorando aposto em complemento de oração: {token.text}")
                     continue
 
@@ -558,7 +774,7 @@ class Extractor:
                 # Cria uma relação sintética "é"
                 relation = TripleElement(text="é")
 
-                logging.debug(f"Extração de aposto: {subject} é {complement}")
+                logging.debug("Extração de aposto: %s é %s", subject, complement)
 
                 if subject and complement:
                     extraction = Extraction(subject, relation, complement)
@@ -579,12 +795,12 @@ class Extractor:
             subj_a_core = appos_extr.subject.core
             subj_b = appos_extr.complement
 
-            logging.debug(f"Aplicando transitividade: {subj_a_core} é {subj_b}")
+            logging.debug("Aplicando transitividade: %s é %s", subj_a_core, subj_b)
 
             for clausal_extr in clausal_extractions:
                 if clausal_extr.subject and clausal_extr.subject.core == subj_a_core:
-                    logging.debug(
-                        f"Encontrada extração transitiva: {subj_a_core} {clausal_extr.relation} {clausal_extr.complement}")
+                    logging.debug("Encontrada extração transitiva: %s %s %s",
+                                  subj_a_core, clausal_extr.relation, clausal_extr.complement)
                     # Cria a nova extração (B, rel, C)
                     new_extraction = Extraction(
                         subject=subj_b,
@@ -599,107 +815,126 @@ class Extractor:
     @classmethod
     def __build_relation_element(cls, start_token: Token, visited_tokens: Set[int]) -> Tuple[
         Optional[TripleElement], Optional[Token]]:
-        """Constrói o elemento da Relação a partir de um token verbal inicial."""
+        """
+        Constrói o elemento da Relação a partir de um token verbal inicial.
+        Os tokens em `visited_tokens` (ex: o sujeito) não entram na relação; o conjunto não é alterado.
+        """
         relation = TripleElement(start_token)
         effective_verb = start_token
 
-        # Usa uma pilha para busca em profundidade de partes do verbo
-        stack = deque([start_token])
-        local_visited = visited_tokens.copy()
-        local_visited.add(start_token.i)
+        # Usa uma pilha para busca em profundidade de partes do verbo. A busca só desce pela
+        # árvore de dependências, então nenhum token é alcançado duas vezes e basta consultar
+        # `visited_tokens`, sem copiá-lo nem marcar os tokens visitados.
+        stack = [start_token]
+        # Acompanha, à medida que os tokens entram na relação, se algum deles é verbal
+        has_verb = start_token.pos in _VERBAL_POS
 
         # Se for uma cópula, o verbo efetivo é o seu head, mas NÃO o adicionamos à relação.
         # A lógica de complemento irá tratar o head da cópula.
-        if start_token.dep_ == 'cop':
+        if start_token.dep == _COP_DEP:
             effective_verb = start_token.head
 
+        # Referências locais evitam buscas de atributos a cada filho visitado
+        child_actions, adverbs = cls._RELATION_CHILD_ACTIONS, cls._RELATION_ADVERBS
+        verb_part_action, modifier_action = cls._VERB_PART_ACTION, cls._MODIFIER_ACTION
+
         while stack:
             current = stack.pop()
-            if current not in relation.get_all_tokens():
+            if current not in relation:
                 relation.add_piece(current)
 
             for child in current.children:
-                if child.i in local_visited: continue
-
-                is_verb_part = child.dep_ in cls._RELATION_VERB_DEPS and child.pos_ in ['VERB', 'AUX']
-                is_rel_adverb = child.dep_ == 'advmod' and child.lemma_.lower() in cls._RELATION_ADVERBS
-                is_extra_rel_dep = child.dep_ in cls._RELATION_MODIFIER_DEPS
-
-                if is_verb_part:
-                    stack.append(child)
-                    local_visited.add(child.i)
-                    if child.i > effective_verb.i:
-                        effective_verb = child
-                elif is_rel_adverb or is_extra_rel_dep:
+                # Uma única consulta decide o tratamento do filho; sujeitos, objetos, pontuação etc.
+                # nunca estendem a relação
+                action = child_actions.get(child.dep)
+                if action is None or child.i in visited_tokens: continue
+
+                if action == verb_part_action:
+                    # Partes da locução verbal só entram se forem de fato verbais
+                    if child.pos in _VERBAL_POS:
+                        stack.append(child)
+                        has_verb = True
+                        if child.i > effective_verb.i:
+                            effective_verb = child
+                # Advérbios (advmod) só entram se estiverem na lista de advérbios da relação
+                elif action == modifier_action or child.lemma_.lower() in adverbs:
                     relation.add_piece(child)
-                    local_visited.add(child.i)
+                    has_verb = has_verb or child.pos in _VERBAL_POS
 
-        if effective_verb and effective_verb.dep_ in ['aux', 'aux:pass',
-                                                      'cop'] and effective_verb.head not in relation.get_all_tokens():
+        if effective_verb and effective_verb.dep in cls._AUXILIARY_DEPS and (
+            effective_verb.head not in relation):
             relation.add_piece(effective_verb.head)
             effective_verb = effective_verb.head
+            has_verb = has_verb or effective_verb.pos in _VERBAL_POS
 
         # Uma relação válida deve conter um verbo
-        has_verb = any(t.pos_ in ['VERB', 'AUX'] for t in relation.get_all_tokens())
         return (relation, effective_verb) if has_verb else (None, None)
 
-    @classmethod
-    def __dfs_for_nominal_phrase(cls, start_token: Token, is_subject: bool = False,
-                                 ignore_appos: bool = False, ignore_conjunctions: bool = False) -> TripleElement:
-        """Realiza uma busca em profundidade para construir um sintagma nominal completo."""
-        element = TripleElement(start_token)
-        stack = deque([start_token])
-        local_visited = {start_token.i}
-
-        valid_deps = cls._NOMINAL_PHRASE_DEPS.copy()
-
-        if not ignore_conjunctions:
-            valid_deps.add("conj")
-            valid_deps.add("cc")
+    @staticmethod
+    def __walk_subtree(element: TripleElement, visited: Optional[Set[int]],
+                       accepts: Callable[[Token, Token], bool]) -> TripleElement:
+        """
+        Busca em profundidade comum às construções de sintagmas: parte do núcleo do elemento
+        e adiciona como peça cada filho ainda não visitado aceito por `accepts(pai, filho)`.
 
-        if not ignore_appos:
-            valid_deps.add("appos")
+        Sem `visited`, a busca não controla visitados: descendo pela árvore de dependências
+        a partir do núcleo, cada token é alcançado uma única vez.
+        """
+        stack = [element.core]
+        add_piece, push = element.add_piece, stack.append
+
+        if visited is None:
+            while stack:
+                current_token = stack.pop()
+                for child in current_token.children:
+                    if accepts(current_token, child):
+                        add_piece(child)
+                        push(child)
+            return element
+
+        visited.add(element.core.i)
+        # Referências locais evitam a busca dos métodos a cada filho visitado
+        mark_visited = visited.add
 
         while stack:
             current_token = stack.pop()
-            for child in sorted(current_token.children, key=lambda t: t.i):
-                if child.i in local_visited: continue
-
-                # Heurística para não incluir preposições que iniciam o sujeito (ex: "De o menino...")
-                if is_subject and current_token.i == start_token.i and child.dep_ == 'case': continue
-
-                is_valid_dep = child.dep_ in valid_deps
-                is_non_verbal_conj = not (child.dep_ == "conj" and child.pos_ in ["VERB", "AUX"])
-
-                if is_valid_dep and is_non_verbal_conj:
-                    element.add_piece(child)
-                    local_visited.add(child.i)
-                    stack.append(child)
+            for child in current_token.children:
+                if child.i not in visited and accepts(current_token, child):
+                    add_piece(child)
+                    mark_visited(child.i)
+                    push(child)
         return element
 
     @classmethod
-    def __dfs_for_complement(cls, start_token: Token, visited_indices: set) -> TripleElement:
-        """Realiza uma busca em profundidade para construir um complemento."""
-        complement = TripleElement(start_token)
-        stack = deque([start_token])
-        local_visited = visited_indices.copy()
-        local_visited.add(start_token.i)
+    def __dfs_for_nominal_phrase(cls, start_token: Token, is_subject: bool = False,
+                                 ignore_appos: bool = False, ignore_conjunctions: bool = False) -> TripleElement:
+        """Realiza uma busca em profundidade para construir um sintagma nominal completo."""
+        valid_deps = cls._NOMINAL_PHRASE_DEP_VARIANTS[(ignore_appos, ignore_conjunctions)]
+        start_i = start_token.i
 
-        # Combina as dependências que devem ser ignoradas com as que delimitam uma conjunção
-        boundary_and_ignore_deps = cls._COMPLEMENT_IGNORE_DEPS | cls._COMPLEMENT_BOUNDARY_DEPS
+        def accepts(parent: Token, child: Token) -> bool:
+            # A dependência é lida uma vez; a maioria dos filhos é decidida só pela consulta ao conjunto
+            dep = child.dep
+            if dep not in valid_deps:
+                return False
+            # Heurística para não incluir preposições que iniciam o sujeito (ex: "De o menino...")
+            if dep == _CASE_DEP:
+                return not (is_subject and parent.i == start_i)
+            # Conjunções verbais não fazem parte do sintagma
+            return dep != _CONJ_DEP or child.pos not in _VERBAL_POS
 
-        while stack:
-            current_token = stack.pop()
-            # Adiciona o token atual se ele não tiver sido visitado
-            if current_token not in complement.get_all_tokens():
-                complement.add_piece(current_token)
+        # O sintagma nominal não depende de tokens usados por outros elementos
+        return cls.__walk_subtree(TripleElement(start_token), None, accepts)
 
-            for child in sorted(current_token.children, key=lambda t: t.i):
-                if child.i not in local_visited and child.dep_ not in boundary_and_ignore_deps:
-                    complement.add_piece(child)
-                    local_visited.add(child.i)
-                    stack.append(child)
-        return complement
+    @classmethod
+    def __dfs_for_complement(cls, start_token: Token, visited_indices: set) -> TripleElement:
+        """
+        Realiza uma busca em profundidade para construir um complemento.
+        Os tokens incorporados são adicionados a `visited_indices`.
+        """
+        stop_deps = cls._COMPLEMENT_STOP_DEPS
+        return cls.__walk_subtree(TripleElement(start_token), visited_indices,
+                                  lambda _, child: child.dep not in stop_deps)
 
     def _is_valid_verbal_conjunction(self, token: Token) -> bool:
         """
@@ -707,18 +942,18 @@ class Extractor:
         que deve ser expandida para uma nova extração.
         Ex: "comprou e vendeu", "canta ou dança".
         """
-        if not (token.dep_ == 'conj' and token.pos_ in ['VERB', 'AUX']):
+        if not (token.dep == _CONJ_DEP and token.pos in _VERBAL_POS):
             return False
 
         # Heurística: Verifica o tipo de conector (cc). Se não houver, assume que é válido.
         # Isso melhora a precisão para casos simples como "e" e "ou".
-        cc_token = next((child for child in token.children if child.dep_ == 'cc'), None)
-        if cc_token and cc_token.lemma_.lower() not in ['e', 'ou']:
+        cc_token = next((child for child in token.children if child.dep == _CC_DEP), None)
+        if cc_token and cc_token.lemma_.lower() not in self._VERBAL_COORDINATORS:
             return False
 
         # Heurística: Se o verbo conjugado tiver seu próprio sujeito explícito,
         # ele iniciará uma nova extração independente, então não deve ser tratado aqui.
-        if any(c.dep_.startswith("nsubj") for c in token.children):
+        if any(_dep_has_prefix(c, "nsubj") for c in token.children):
             return False
 
         return True
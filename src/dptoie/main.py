@@ -16,37 +16,40 @@ from typing import Any, Generator
 from spacy_conll.parser import ConllParser
 from dptoie.extraction import Extractor, ExtractorConfig, Extraction
 
+# Quantidade de sentenças processadas por lote pelo `nlp.pipe` (ajustável via `DPTOIE_PIPE_BATCH_SIZE`)
+PIPE_BATCH_SIZE = int(os.environ.get("DPTOIE_PIPE_BATCH_SIZE", "64"))
+
 def generate_conll_file_from_sentences_file(input_file: str) -> str:
     tokenizer = stanza.Pipeline(lang='pt', processors='tokenize, mwt', use_gpu=False)
     nlp = spacy_stanza.load_pipeline("pt", tokenize_pretokenized=True, use_gpu=False)
     nlp.add_pipe("conll_formatter", last=True)
     connl_file = './outputs/input.conll'
 
-    with open(connl_file, 'w') as f:
-        f.write('')
-
     # 2. Pega o tamanho total do arquivo de entrada em bytes
     file_size = os.path.getsize(input_file)
 
-    with open(input_file, 'r', encoding='utf-8') as f:
+    with open(input_file, 'r', encoding='utf-8') as f, open(connl_file, 'w', encoding='utf-8') as fout:
         with tqdm(total=file_size,
                   desc="Gerando árvores de dependência",
                   unit='B',  # Define a unidade como Bytes
                   unit_scale=True,  # Mostra KB, MB, GB automaticamente
                   unit_divisor=1024) as pbar:
-            for line in f:
-                if line.strip():
-                    sentence = line.strip()
-                    # Process the sentence with Stanza tokenizer
-                    doc = tokenizer(sentence)
-                    # Convert Stanza Doc to SpaCy Doc
-                    spacy_doc = nlp(' '.join([word.text for sent in doc.sentences for word in sent.words]))
-                    with open(connl_file, 'a', encoding='utf-8') as fout:
-                        fout.write(spacy_doc._.conll_str)
-                        fout.write('\n')
-
-                # Atualiza a barra com o número de bytes da linha lida
-                pbar.update(len(line.encode('utf-8')))
+
+            def pretokenized_sentences() -> Generator[str, Any, None]:
+                for line in f:
+                    if line.strip():
+                        sentence = line.strip()
+                        # Process the sentence with Stanza tokenizer
+                        doc = tokenizer(sentence)
+                        yield ' '.join([word.text for sent in doc.sentences for word in sent.words])
+
+                    # Atualiza a barra com o número de bytes da linha lida
+                    pbar.update(len(line.encode('utf-8')))
+
+            # Convert Stanza Doc to SpaCy Doc, em lotes
+            for spacy_doc in nlp.pipe(pretokenized_sentences(), batch_size=PIPE_BATCH_SIZE):
+                fout.write(spacy_doc._.conll_str)
+                fout.write('\n')
 
     return connl_file
 
@@ -58,9 +61,8 @@ def extract_to_json(nlp: Language, input_file: str, output_file: str):
         f.write('[\n')
 
         is_first_item = True
+        conll_parser = ConllParser(nlp)
         for conll_sentence_block in tqdm(sentence_iterator, desc="Extraindo informações"):
-
-            conll_parser = ConllParser(nlp)
             doc = conll_parser.parse_conll_text_as_spacy(conll_sentence_block)
 
             extractions = doc._.extractions
@@ -106,8 +108,8 @@ def extract_to_csv(nlp: Language, input_file: str, output_file: str):
 
         print(f"Processando sentenças de '{input_file}' e salvando em '{output_file}'...")
 
+        conll_parser = ConllParser(nlp)
         for conll_sentence_block in tqdm(sentence_iterator, desc="Extraindo informações"):
-            conll_parser = ConllParser(nlp)
             doc = conll_parser.parse_conll_text_as_spacy(conll_sentence_block)
             extractions: list[Extraction] = doc._.extractions
 
@@ -150,8 +152,8 @@ def extract_to_txt(nlp: Language, input_file: str, output_file: str):
     with open(output_file, 'w', encoding='utf-8') as f:
 
         indice_output = 0
+        conll_parser = ConllParser(nlp)
         for conll_sentence_block in tqdm(sentence_iterator, desc="Extraindo informações"):
-            conll_parser = ConllParser(nlp)
             doc = conll_parser.parse_conll_text_as_spacy(conll_sentence_block)
 
             f.write(f"{doc.text.strip()}\n")